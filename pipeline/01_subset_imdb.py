@@ -9,7 +9,12 @@ import argparse
 import sys
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
@@ -22,7 +27,7 @@ from pipeline.config import (
     EPISODES_TSV,
     RATINGS_TSV,
     BASICS_TSV,
-    CHUNK_SIZE,
+    READ_BLOCK_SIZE,
     EPISODES_FILTERED_COLS,
     SHOWS_METADATA_COLS,
     EPISODES_BASICS_COLS,
@@ -41,12 +46,97 @@ def parse_args():
     return parser.parse_args()
 
 
+def scan_tsv(path, columns, key_col, keep_ids, column_types=None):
+    """Stream an IMDb TSV, keeping only rows whose key_col is in keep_ids.
+
+    keep_ids is a pa.Array of tconsts, built once by the caller and used as
+    the is_in value set for every batch.
+
+    The .tsv.gz files from datasets.imdbws.com are decompressed on the fly,
+    so they never need to be gunzipped on disk. Columns are read as strings
+    unless overridden in column_types, with "\\N" as NULL. IMDb TSVs are
+    unquoted, so quote handling is disabled. Returns (filtered pa.Table,
+    total rows scanned).
+    """
+    types = {col: pa.string() for col in columns}
+    types.update(column_types or {})
+
+    batches = []
+    total_rows = 0
+    # compression="detect" picks gzip from the .gz suffix (plain .tsv also works)
+    with pa.input_stream(str(path), compression="detect") as src:
+        reader = pacsv.open_csv(
+            src,
+            read_options=pacsv.ReadOptions(
+                block_size=READ_BLOCK_SIZE, use_threads=True
+            ),
+            parse_options=pacsv.ParseOptions(delimiter="\t", quote_char=False),
+            convert_options=pacsv.ConvertOptions(
+                null_values=["\\N"],
+                strings_can_be_null=True,
+                include_columns=columns,
+                column_types=types,
+            ),
+        )
+        for batch in reader:
+            total_rows += batch.num_rows
+            filtered = batch.filter(
+                pc.is_in(batch.column(key_col), value_set=keep_ids)
+            )
+            if filtered.num_rows > 0:
+                batches.append(filtered)
+
+    table = pa.Table.from_batches(batches, schema=reader.schema)
+    return table, total_rows
+
+
+def clean_episodes(df, columns):
+    """Drop rows that fail the episode inclusion rules for the given columns.
+
+    Rules are applied in column order: NULL in each column, plus
+    season_num == 0 (specials) right after the season_num NULL check. All
+    rules are evaluated as masks and the frame is indexed once. Returns
+    (cleaned copy, {reason: dropped count}), with each dropped row counted
+    only under the first rule it fails.
+    """
+    dropped = np.zeros(len(df), dtype=bool)
+    counts = {}
+    for col in columns:
+        rules = [(f"null_{col}", df[col].isna().to_numpy())]
+        if col == "season_num":
+            rules.append(
+                ("zero_season_num", df[col].eq(0).fillna(False).to_numpy(dtype=bool))
+            )
+        for reason, mask in rules:
+            counts[reason] = int((mask & ~dropped).sum())
+            dropped |= mask
+
+    return df[~dropped].copy(), counts
+
+
+def write_output(df, name):
+    """Write df to OUTPUT_DIR as <name>.csv and <name>.parquet (no index).
+
+    The CSV is the human/QA-facing contract; the zstd Parquet copy keeps
+    dtypes for 02_run_sql.py so DuckDB does not re-parse text.
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pacsv.write_csv(table, str(OUTPUT_DIR / f"{name}.csv"))
+    pq.write_table(table, str(OUTPUT_DIR / f"{name}.parquet"), compression="zstd")
+
+
 # ─── Default mode: real IMDb TSVs ────────────────────────────
 
 
 def run_default_mode():
-    """Process real IMDb TSV files from RAW_DIR, write cleaned CSVs to OUTPUT_DIR."""
-    show_tconst_set = set(SHOW_IDS.keys())
+    """Process real IMDb TSV files from RAW_DIR, write cleaned CSVs to OUTPUT_DIR.
+
+    Each TSV is scanned exactly once with scan_tsv(), which applies the
+    tconst filter per batch (episodes by show, then ratings and basics by
+    the surviving episode ids). Filtering stays in Python by design: raw
+    TSVs are never loaded into SQL, only the small filtered CSVs are.
+    """
+    show_ids = pa.array(sorted(SHOW_IDS), type=pa.string())
 
     # ── Step a: Filter title.episode ──────────────────────────
     print("Step a: Reading title.episode...")
@@ -56,17 +146,14 @@ def run_default_mode():
         print("Download from https://datasets.imdbws.com/ and place in", RAW_DIR)
         sys.exit(1)
 
-    ep_chunks = []
-    total_rows = 0
-    for chunk in pd.read_csv(
-        episode_path, sep="\t", na_values=["\\N"], chunksize=CHUNK_SIZE, dtype=str
-    ):
-        total_rows += len(chunk)
-        filtered = chunk[chunk["parentTconst"].isin(show_tconst_set)]
-        if len(filtered) > 0:
-            ep_chunks.append(filtered)
-
-    episodes = pd.concat(ep_chunks, ignore_index=True) if ep_chunks else pd.DataFrame()
+    ep_table, total_rows = scan_tsv(
+        episode_path,
+        ["tconst", "parentTconst", "seasonNumber", "episodeNumber"],
+        "parentTconst",
+        show_ids,
+        column_types={"seasonNumber": pa.int32(), "episodeNumber": pa.int32()},
+    )
+    episodes = ep_table.to_pandas(types_mapper=pd.ArrowDtype)
     print(f"  Read {total_rows:,} total rows, found {len(episodes)} episodes for selected shows")
 
     # Rename columns to snake_case
@@ -79,29 +166,16 @@ def run_default_mode():
         }
     )
 
-    # Drop specials: NULL season_num
-    before = len(episodes)
-    episodes = episodes.dropna(subset=["season_num"])
-    dropped_null_season = before - len(episodes)
-
-    # Cast season_num to int, then drop season_num == 0
-    episodes["season_num"] = episodes["season_num"].astype(int)
-    before = len(episodes)
-    episodes = episodes[episodes["season_num"] != 0]
-    dropped_zero_season = before - len(episodes)
+    # Drop specials (NULL/0 season) and NULL episode numbers
+    episodes, dropped = clean_episodes(episodes, ["season_num", "episode_num"])
     print(
-        f"  Dropped {dropped_null_season} NULL seasonNumber, "
-        f"{dropped_zero_season} seasonNumber=0"
+        f"  Dropped {dropped['null_season_num']} NULL seasonNumber, "
+        f"{dropped['zero_season_num']} seasonNumber=0"
     )
+    print(f"  Dropped {dropped['null_episode_num']} NULL episodeNumber")
 
-    # Drop NULL episode_num
-    before = len(episodes)
-    episodes = episodes.dropna(subset=["episode_num"])
-    episodes["episode_num"] = episodes["episode_num"].astype(int)
-    print(f"  Dropped {before - len(episodes)} NULL episodeNumber")
-
-    episode_tconst_set = set(episodes["episode_tconst"])
-    print(f"  {len(episode_tconst_set)} unique episode tconsts after filtering")
+    episode_ids = pc.unique(pa.array(episodes["episode_tconst"], type=pa.string()))
+    print(f"  {len(episode_ids)} unique episode tconsts after filtering")
 
     # ── Step b: Filter title.ratings ──────────────────────────
     print("\nStep b: Reading title.ratings...")
@@ -111,10 +185,14 @@ def run_default_mode():
         print("Download from https://datasets.imdbws.com/ and place in", RAW_DIR)
         sys.exit(1)
 
-    ratings = pd.read_csv(
-        ratings_path, sep="\t", na_values=["\\N"], dtype={"tconst": str}
+    ratings_table, _ = scan_tsv(
+        ratings_path,
+        ["tconst", "averageRating", "numVotes"],
+        "tconst",
+        episode_ids,
+        column_types={"averageRating": pa.float64(), "numVotes": pa.int32()},
     )
-    ratings = ratings[ratings["tconst"].isin(episode_tconst_set)]
+    ratings = ratings_table.to_pandas(types_mapper=pd.ArrowDtype)
     ratings = ratings.rename(
         columns={
             "tconst": "episode_tconst",
@@ -126,32 +204,34 @@ def run_default_mode():
 
     # ── Step c: INNER JOIN episodes <-> ratings ───────────────
     print("\nStep c: Joining episodes and ratings...")
-    joined = episodes.merge(ratings, on="episode_tconst", how="inner")
+    # Shared categorical key (categories = episode_ids) so the join compares
+    # int codes rather than hashing tconst strings on both sides
+    tconst_dtype = pd.CategoricalDtype(categories=episode_ids.to_pandas())
+    episodes["episode_tconst"] = episodes["episode_tconst"].astype(tconst_dtype)
+    ratings["episode_tconst"] = ratings["episode_tconst"].astype(tconst_dtype)
+
+    # Index-aligned join on the key; keeps episode order like merge(how="inner")
+    joined = (
+        episodes.set_index("episode_tconst")
+        .join(ratings.set_index("episode_tconst"), how="inner", sort=False)
+        .reset_index()
+    )
     print(
         f"  {len(joined)} episodes after inner join "
         f"(dropped {len(episodes) - len(joined)} without ratings)"
     )
 
-    # Drop NULL avg_rating
-    before = len(joined)
-    joined = joined.dropna(subset=["avg_rating"])
-    print(f"  Dropped {before - len(joined)} rows with NULL avg_rating")
-
-    # Drop NULL num_votes
-    before = len(joined)
-    joined = joined.dropna(subset=["num_votes"])
-    print(f"  Dropped {before - len(joined)} rows with NULL num_votes")
+    # Drop NULL avg_rating / num_votes
+    joined, dropped = clean_episodes(joined, ["avg_rating", "num_votes"])
+    print(f"  Dropped {dropped['null_avg_rating']} rows with NULL avg_rating")
+    print(f"  Dropped {dropped['null_num_votes']} rows with NULL num_votes")
 
     # Log zero-vote episodes (keep them)
     zero_votes = (joined["num_votes"] == 0).sum()
     if zero_votes > 0:
         print(f"  NOTE: {zero_votes} episodes with num_votes=0 (kept)")
 
-    # Cast types
-    joined["avg_rating"] = joined["avg_rating"].astype(float)
-    joined["num_votes"] = joined["num_votes"].astype(int)
-
-    # ── Step d: Filter title.basics (chunked) ─────────────────
+    # ── Step d: Filter title.basics (streamed) ────────────────
     print("\nStep d: Reading title.basics...")
     basics_path = RAW_DIR / BASICS_TSV
     if not basics_path.exists():
@@ -160,24 +240,29 @@ def run_default_mode():
         sys.exit(1)
 
     # Combined filter: episode tconsts (for titleType) + show tconsts (for metadata)
-    combined_tconst_set = episode_tconst_set | show_tconst_set
+    combined_ids = pa.concat_arrays([episode_ids, show_ids])
 
-    basics_chunks = []
-    total_rows = 0
-    for chunk in pd.read_csv(
-        basics_path, sep="\t", na_values=["\\N"], chunksize=CHUNK_SIZE, dtype=str
-    ):
-        total_rows += len(chunk)
-        filtered = chunk[chunk["tconst"].isin(combined_tconst_set)]
-        if len(filtered) > 0:
-            basics_chunks.append(filtered)
-
-    basics = pd.concat(basics_chunks, ignore_index=True) if basics_chunks else pd.DataFrame()
-    print(f"  Read {total_rows:,} total rows, found {len(basics)} matching rows")
-
-    # Split into episode-level and show-level basics
-    ep_basics = basics[basics["tconst"].isin(episode_tconst_set)].copy()
-    show_basics = basics[basics["tconst"].isin(show_tconst_set)].copy()
+    basics_table, total_rows = scan_tsv(
+        basics_path,
+        ["tconst", "titleType", "primaryTitle", "startYear", "endYear", "genres"],
+        "tconst",
+        combined_ids,
+    )
+    print(
+        f"  Read {total_rows:,} total rows, "
+        f"found {basics_table.num_rows} matching rows"
+    )
+
+    # Split into episode-level and show-level basics with a single membership
+    # probe: every row is in combined_ids, so non-show rows are episodes
+    is_show = pc.is_in(
+        basics_table.column("tconst"),
+        value_set=show_ids,
+    )
+    show_basics = basics_table.filter(is_show).to_pandas(types_mapper=pd.ArrowDtype)
+    ep_basics = basics_table.filter(pc.invert(is_show)).to_pandas(
+        types_mapper=pd.ArrowDtype
+    )
     print(
         f"  Episode-level basics: {len(ep_basics)}, "
         f"Show-level basics: {len(show_basics)}"
@@ -186,18 +271,22 @@ def run_default_mode():
     # ── Step e: Verify titleType == "tvEpisode" ───────────────
     print("\nStep e: Verifying titleType...")
 
-    # Build lookup: episode_tconst -> titleType
+    # Build lookup: episode_tconst -> titleType (unique index for reindex)
     ep_basics_dedup = ep_basics.drop_duplicates(subset=["tconst"])
-    ep_basics_map = dict(zip(ep_basics_dedup["tconst"], ep_basics_dedup["titleType"]))
+    title_type_lut = ep_basics_dedup.set_index("tconst")["titleType"]
 
     # Check each episode in the joined set (split missing-basics vs wrong-titleType logs)
-    title_type = joined["episode_tconst"].map(ep_basics_map)
+    title_type = title_type_lut.reindex(joined["episode_tconst"].to_numpy()).to_numpy(
+        dtype=object, na_value=None
+    )
+    is_missing = pd.isna(title_type)
+    is_tv_episode = title_type == "tvEpisode"
 
-    missing_basics = int(title_type.isna().sum())
-    wrong_title_type = int((~title_type.isna() & (title_type != "tvEpisode")).sum())
+    missing_basics = int(is_missing.sum())
+    wrong_title_type = int((~is_missing & ~is_tv_episode).sum())
 
     # Keep only verified tvEpisode (this also drops missing basics rows)
-    joined = joined[title_type == "tvEpisode"].copy()
+    joined = joined[is_tv_episode].copy()
 
     if missing_basics:
         print(f"  Dropped {missing_basics} episodes with missing basics row / NULL titleType")
@@ -207,6 +296,9 @@ def run_default_mode():
     # ── Step f: Prepare and write outputs ─────────────────────
     print("\nStep f: Preparing outputs...")
 
+    # Low-cardinality key columns (<= 4 shows, 1 titleType) as categoricals
+    joined["show_tconst"] = joined["show_tconst"].astype("category")
+
     # episodes_filtered.csv — only episodes that passed all checks
     episodes_out = joined[EPISODES_FILTERED_COLS].copy()
 
@@ -217,6 +309,7 @@ def run_default_mode():
     valid_ep_basics = valid_ep_basics.rename(
         columns={"tconst": "episode_tconst", "titleType": "title_type"}
     )
+    valid_ep_basics["title_type"] = valid_ep_basics["title_type"].astype("category")
     basics_out = valid_ep_basics[EPISODES_BASICS_COLS]
 
     # shows_metadata.csv — one row per show
@@ -232,6 +325,7 @@ def run_default_mode():
         }
     )
     shows_out = shows_out.drop_duplicates(subset=["show_tconst"])
+    shows_out["show_tconst"] = shows_out["show_tconst"].astype("category")
 
     # Key alignment check
     ep_set = set(episodes_out["episode_tconst"])
@@ -255,15 +349,15 @@ def run_default_mode():
 
     # Write outputs
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    episodes_out.to_csv(OUTPUT_DIR / "episodes_filtered.csv", index=False)
-    shows_out.to_csv(OUTPUT_DIR / "shows_metadata.csv", index=False)
-    basics_out.to_csv(OUTPUT_DIR / "episodes_basics.csv", index=False)
+    write_output(episodes_out, "episodes_filtered")
+    write_output(shows_out, "shows_metadata")
+    write_output(basics_out, "episodes_basics")
 
     # Per-show summary
     print("\nFinal episode counts per show:")
+    counts = episodes_out["show_tconst"].value_counts()
     for tconst, title in SHOW_IDS.items():
-        count = (episodes_out["show_tconst"] == tconst).sum()
-        print(f"  {title}: {count}")
+        print(f"  {title}: {counts.get(tconst, 0)}")
 
     print(f"\nOutputs written to {OUTPUT_DIR}")
 
@@ -284,9 +378,19 @@ def run_sample_mode():
             print(f"ERROR: {p} not found. Run qa/fixtures/generate_synthetic.py first.")
             sys.exit(1)
 
-    ep_df = pd.read_csv(ep_path)
-    shows_df = pd.read_csv(shows_path)
-    basics_df = pd.read_csv(basics_path)
+    read_opts = {"engine": "pyarrow", "dtype_backend": "pyarrow"}
+    ep_df = pd.read_csv(
+        ep_path,
+        dtype={
+            "season_num": "int32[pyarrow]",
+            "episode_num": "int32[pyarrow]",
+            "avg_rating": "double[pyarrow]",
+            "num_votes": "int32[pyarrow]",
+        },
+        **read_opts,
+    )
+    shows_df = pd.read_csv(shows_path, **read_opts)
+    basics_df = pd.read_csv(basics_path, **read_opts)
     print(
         f"Read {len(ep_df)} episodes, {len(shows_df)} shows, "
         f"{len(basics_df)} basics rows"
@@ -305,46 +409,23 @@ def run_sample_mode():
 
     # ── Apply cleaning/validation (same rules as default mode) ──
 
-    # Drop NULL/0 season_num
-    before = len(ep_df)
-    ep_df = ep_df.dropna(subset=["season_num"])
-    ep_df["season_num"] = ep_df["season_num"].astype(int)
-    ep_df = ep_df[ep_df["season_num"] != 0]
-    dropped = before - len(ep_df)
-    if dropped:
-        print(f"  Dropped {dropped} rows with NULL/0 season_num")
-
-    # Drop NULL episode_num
-    before = len(ep_df)
-    ep_df = ep_df.dropna(subset=["episode_num"])
-    ep_df["episode_num"] = ep_df["episode_num"].astype(int)
-    dropped = before - len(ep_df)
-    if dropped:
-        print(f"  Dropped {dropped} rows with NULL episode_num")
-
-    # Drop NULL avg_rating
-    before = len(ep_df)
-    ep_df = ep_df.dropna(subset=["avg_rating"])
-    dropped = before - len(ep_df)
-    if dropped:
-        print(f"  Dropped {dropped} rows with NULL avg_rating")
-
-    # Drop NULL num_votes
-    before = len(ep_df)
-    ep_df = ep_df.dropna(subset=["num_votes"])
-    dropped = before - len(ep_df)
-    if dropped:
-        print(f"  Dropped {dropped} rows with NULL num_votes")
+    ep_df, dropped = clean_episodes(
+        ep_df, ["season_num", "episode_num", "avg_rating", "num_votes"]
+    )
+    for count, reason in [
+        (dropped["null_season_num"] + dropped["zero_season_num"], "NULL/0 season_num"),
+        (dropped["null_episode_num"], "NULL episode_num"),
+        (dropped["null_avg_rating"], "NULL avg_rating"),
+        (dropped["null_num_votes"], "NULL num_votes"),
+    ]:
+        if count:
+            print(f"  Dropped {count} rows with {reason}")
 
     # Log zero-vote episodes (keep them)
     zero_votes = (ep_df["num_votes"] == 0).sum()
     if zero_votes > 0:
         print(f"  NOTE: {zero_votes} episodes with num_votes=0 (kept)")
 
-    # Cast types
-    ep_df["avg_rating"] = ep_df["avg_rating"].astype(float)
-    ep_df["num_votes"] = ep_df["num_votes"].astype(int)
-
     # titleType check — drop episodes not in basics or with wrong title_type
     valid_basics = basics_df[basics_df["title_type"] == "tvEpisode"]
     valid_tconsts = set(valid_basics["episode_tconst"])
@@ -361,15 +442,15 @@ def run_sample_mode():
 
     # Write to output dir
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    ep_df.to_csv(OUTPUT_DIR / "episodes_filtered.csv", index=False)
-    shows_df.to_csv(OUTPUT_DIR / "shows_metadata.csv", index=False)
-    basics_df.to_csv(OUTPUT_DIR / "episodes_basics.csv", index=False)
+    write_output(ep_df, "episodes_filtered")
+    write_output(shows_df, "shows_metadata")
+    write_output(basics_df, "episodes_basics")
 
     # Per-show summary
     print("\nFinal episode counts per show:")
+    counts = ep_df["show_tconst"].value_counts()
     for tconst, title in SHOW_IDS.items():
-        count = (ep_df["show_tconst"] == tconst).sum()
-        print(f"  {title}: {count}")
+        print(f"  {title}: {counts.get(tconst, 0)}")
 
     print(f"\nOutputs written to {OUTPUT_DIR}")
 
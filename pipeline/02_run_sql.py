@@ -1,16 +1,16 @@
 """Execute DuckDB SQL pipeline: schema, KPIs, shark-jump, durability.
 
 Usage:
-    python pipeline/02_run_sql.py            # Process data/ CSVs
+    python pipeline/02_run_sql.py            # Process data/ Parquet (from stage 01)
     python pipeline/02_run_sql.py --sample   # Process data/sample/ CSVs
 """
 
 import argparse
+import re
 import sys
 from pathlib import Path
 
 import duckdb
-import pandas as pd
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
@@ -18,6 +18,7 @@ sys.path.insert(0, str(PROJECT_ROOT))
 from pipeline.config import SHOW_IDS, OUTPUT_DIR, SAMPLE_DIR, DIM_SHOW_PATH
 
 SQL_DIR = PROJECT_ROOT / "sql"
+SQL_TOKEN_RE = re.compile(r"__[A-Z]+_SRC__")
 
 
 def parse_args():
@@ -31,27 +32,45 @@ def parse_args():
 
 
 def resolve_paths(is_sample: bool) -> dict:
-    """Return placeholder -> resolved path mapping."""
+    """Return placeholder -> resolved input path mapping.
+
+    Full mode reads the typed Parquet copies written by 01_subset_imdb.py;
+    sample mode reads the committed CSV fixtures in data/sample/.
+    """
     if is_sample:
-        data_dir = SAMPLE_DIR
+        data_dir, ext = SAMPLE_DIR, "csv"
     else:
-        data_dir = OUTPUT_DIR
+        data_dir, ext = OUTPUT_DIR, "parquet"
 
     paths = {
-        "__EPISODES_CSV__": str(data_dir / "episodes_filtered.csv"),
-        "__SHOWS_CSV__": str(data_dir / "shows_metadata.csv"),
-        "__CATEGORY_CSV__": str(DIM_SHOW_PATH),
+        "__EPISODES_SRC__": str(data_dir / f"episodes_filtered.{ext}"),
+        "__SHOWS_SRC__": str(data_dir / f"shows_metadata.{ext}"),
+        "__CATEGORY_SRC__": str(DIM_SHOW_PATH),
     }
     return paths
 
 
-def read_sql(filename: str, path_map: dict) -> str:
-    """Read a SQL file and replace placeholder tokens with resolved paths."""
-    sql_path = SQL_DIR / filename
-    sql_text = sql_path.read_text()
-    for token, resolved in path_map.items():
-        sql_text = sql_text.replace(token, resolved)
-    return sql_text
+def source_sql(path: str) -> str:
+    """Return the DuckDB table function that scans path (Parquet or CSV)."""
+    if path.endswith(".parquet"):
+        return f"read_parquet('{path}')"
+    return f"read_csv_auto('{path}', header = true, all_varchar = true)"
+
+
+def load_sql_scripts(path_map: dict) -> dict:
+    """Read every sql/*.sql file once, resolving placeholder tokens in one pass."""
+    sources = {token: source_sql(path) for token, path in path_map.items()}
+    return {
+        sql_path.name: SQL_TOKEN_RE.sub(
+            lambda m: sources[m.group(0)], sql_path.read_text()
+        )
+        for sql_path in sorted(SQL_DIR.glob("*.sql"))
+    }
+
+
+def export_csv(con, table: str, path: Path):
+    """Write a DuckDB table to CSV (with header) via COPY, bypassing pandas."""
+    con.execute(f"COPY {table} TO '{path}' (FORMAT CSV, HEADER)")
 
 
 def main():
@@ -60,7 +79,7 @@ def main():
     path_map = resolve_paths(args.sample)
 
     print(f"=== DuckDB SQL Pipeline (mode: {mode}) ===\n")
-    print("Resolved CSV paths:")
+    print("Resolved input paths:")
     for token, path in path_map.items():
         print(f"  {token} -> {path}")
     print()
@@ -71,12 +90,12 @@ def main():
             print(f"ERROR: {path} not found (token: {token})")
             sys.exit(1)
 
+    scripts = load_sql_scripts(path_map)
     con = duckdb.connect(":memory:")
 
     # ── 01: Schema ───────────────────────────────────────────────
     print("Running sql/01_schema.sql ...")
-    schema_sql = read_sql("01_schema.sql", path_map)
-    con.execute(schema_sql)
+    con.execute(scripts["01_schema.sql"])
 
     dim_show_count = con.execute("SELECT COUNT(*) FROM dim_show").fetchone()[0]
     fact_ep_count = con.execute("SELECT COUNT(*) FROM fact_episode").fetchone()[0]
@@ -85,59 +104,72 @@ def main():
 
     # ── 02: Season KPIs ──────────────────────────────────────────
     print("Running sql/02_season_kpis.sql ...")
-    kpi_sql = read_sql("02_season_kpis.sql", path_map)
-    con.execute(kpi_sql)
+    con.execute(scripts["02_season_kpis.sql"])
 
-    kpi_df = con.execute("SELECT * FROM agg_season_kpis").fetchdf()
-    print(f"  agg_season_kpis: {len(kpi_df)} rows\n")
+    kpi_count = con.execute("SELECT COUNT(*) FROM agg_season_kpis").fetchone()[0]
+    print(f"  agg_season_kpis: {kpi_count} rows\n")
 
     # ── 03: Shark-jump detection ─────────────────────────────────
     print("Running sql/03_shark_jump.sql ...")
-    shark_sql = read_sql("03_shark_jump.sql", path_map)
-    shark_df = con.execute(shark_sql).fetchdf()
-    print(f"  shark_jump_results: {len(shark_df)} rows\n")
+    con.execute(scripts["03_shark_jump.sql"])
+
+    shark_count = con.execute("SELECT COUNT(*) FROM shark_jump_results").fetchone()[0]
+    print(f"  shark_jump_results: {shark_count} rows\n")
 
     # ── 04: Durability index ─────────────────────────────────────
     print("Running sql/04_durability.sql ...")
-    dur_sql = read_sql("04_durability.sql", path_map)
-    dur_df = con.execute(dur_sql).fetchdf()
-    print(f"  durability_index: {len(dur_df)} rows\n")
+    con.execute(scripts["04_durability.sql"])
+
+    dur_count = con.execute("SELECT COUNT(*) FROM durability_index").fetchone()[0]
+    print(f"  durability_index: {dur_count} rows\n")
 
     # ── Export CSVs ──────────────────────────────────────────────
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
-    kpi_df.to_csv(OUTPUT_DIR / "agg_season_kpis.csv", index=False)
-    shark_df.to_csv(OUTPUT_DIR / "shark_jump_results.csv", index=False)
-    dur_df.to_csv(OUTPUT_DIR / "durability_index.csv", index=False)
+    for table in ["agg_season_kpis", "shark_jump_results", "durability_index"]:
+        export_csv(con, table, OUTPUT_DIR / f"{table}.csv")
 
     print(f"Exported CSVs to {OUTPUT_DIR}:")
-    print(f"  agg_season_kpis.csv    ({len(kpi_df)} rows)")
-    print(f"  shark_jump_results.csv ({len(shark_df)} rows)")
-    print(f"  durability_index.csv   ({len(dur_df)} rows)")
+    print(f"  agg_season_kpis.csv    ({kpi_count} rows)")
+    print(f"  shark_jump_results.csv ({shark_count} rows)")
+    print(f"  durability_index.csv   ({dur_count} rows)")
 
     # ── Summary ──────────────────────────────────────────────────
     print(f"\n{'='*50}")
     print("Summary:")
     print(f"  Shows processed: {dim_show_count}")
 
-    seasons_per_show = kpi_df.groupby("show_tconst")["season_num"].count()
+    seasons_per_show = dict(
+        con.execute(
+            "SELECT show_tconst, COUNT(*) FROM agg_season_kpis GROUP BY show_tconst"
+        ).fetchall()
+    )
     for tconst, title in SHOW_IDS.items():
         n_seasons = seasons_per_show.get(tconst, 0)
         print(f"  {title}: {n_seasons} seasons")
 
+    # One small join feeds both result listings (NULL -> None)
+    show_results = con.execute(
+        """
+        SELECT s.show_tconst, s.shark_jump_season, d.durability_index
+        FROM shark_jump_results s
+        JOIN durability_index d USING (show_tconst)
+        ORDER BY s.show_tconst
+        """
+    ).fetchall()
+
     print("\nShark-jump results:")
-    for _, row in shark_df.iterrows():
-        title = SHOW_IDS.get(row["show_tconst"], row["show_tconst"])
-        sj = row["shark_jump_season"]
-        if pd.isna(sj):
+    for tconst, sj, _ in show_results:
+        title = SHOW_IDS.get(tconst, tconst)
+        if sj is None:
             print(f"  {title}: No shark-jump detected")
         else:
             print(f"  {title}: Season {int(sj)}")
 
     print("\nDurability index:")
-    for _, row in dur_df.iterrows():
-        title = SHOW_IDS.get(row["show_tconst"], row["show_tconst"])
-        print(f"  {title}: {int(row['durability_index'])} seasons above avg")
+    for tconst, _, di in show_results:
+        title = SHOW_IDS.get(tconst, tconst)
+        print(f"  {title}: {int(di)} seasons above avg")
 
     con.close()
     print(f"\nDone.")
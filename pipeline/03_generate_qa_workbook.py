@@ -8,10 +8,15 @@ Usage:
 import argparse
 import math
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
+from functools import partial
+from itertools import zip_longest
 from pathlib import Path
 
 import pandas as pd
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill
 from openpyxl.utils import get_column_letter
 
@@ -28,6 +33,14 @@ RED_FILL = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="soli
 YELLOW_FILL = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")
 BOLD_FONT = Font(bold=True)
 
+# QA_Summary row fill by result
+RESULT_FILLS = {
+    "PASS": GREEN_FILL,
+    "FAIL": RED_FILL,
+    "MANUAL": YELLOW_FILL,
+    "SKIP": YELLOW_FILL,
+}
+
 
 def parse_args():
     parser = argparse.ArgumentParser(
@@ -56,7 +69,12 @@ def load_and_validate(data_dir: Path, is_sample: bool):
             print(f"ERROR: Required file not found: {path}")
             sys.exit(1)
 
-    dfs = {name: pd.read_csv(path) for name, path in files.items()}
+    # Multi-threaded Arrow parser; NumPy-backed result so NaN/None cells keep
+    # writing to openpyxl as before. The four reads are independent, so they
+    # also overlap each other's disk I/O.
+    with ThreadPoolExecutor(max_workers=len(files)) as pool:
+        frames = pool.map(partial(pd.read_csv, engine="pyarrow"), files.values())
+        dfs = dict(zip(files, frames))
 
     for name, df in dfs.items():
         if len(df) == 0:
@@ -85,32 +103,80 @@ def load_and_validate(data_dir: Path, is_sample: bool):
     return dfs
 
 
-def auto_width(ws):
-    """Approximate auto-width for all columns."""
-    for col_cells in ws.columns:
-        max_len = 0
-        col_letter = get_column_letter(col_cells[0].column)
-        for cell in col_cells:
-            val = str(cell.value) if cell.value is not None else ""
-            max_len = max(max_len, len(val))
-        ws.column_dimensions[col_letter].width = min(max_len + 3, 50)
-
+def categorize_show_keys(dfs):
+    """Cast show_tconst to one categorical dtype shared by every input frame.
 
-def freeze_and_bold_header(ws):
-    """Bold header row and freeze top row."""
-    ws.freeze_panes = "A2"
-    for cell in ws[1]:
-        cell.font = BOLD_FONT
+    A shared category set keeps merges between the frames on integer codes
+    instead of falling back to string hashing.
+    """
+    shows = (
+        pd.concat([df["show_tconst"] for df in dfs.values()], ignore_index=True)
+        .dropna()
+        .drop_duplicates()
+        .sort_values()
+    )
+    show_dtype = pd.CategoricalDtype(categories=shows)
+    for df in dfs.values():
+        df["show_tconst"] = df["show_tconst"].astype(show_dtype)
+
+
+def auto_width(ws, rows):
+    """Approximate auto-width from row values (set before rows are streamed)."""
+    for col_idx, col_vals in enumerate(zip_longest(*rows), 1):
+        max_len = max((len(str(v)) for v in col_vals if v is not None), default=0)
+        ws.column_dimensions[get_column_letter(col_idx)].width = min(max_len + 3, 50)
+
+
+def styled_row(ws, values, font=None, fill=None):
+    """Wrap a row of values in WriteOnlyCells carrying an optional font/fill."""
+    # Register font/fill with the workbook style tables once per row, then
+    # share the resulting style ids with every cell
+    template = WriteOnlyCell(ws)
+    if font is not None:
+        template.font = font
+    if fill is not None:
+        template.fill = fill
+    style = template._style
+
+    cells = []
+    for val in values:
+        cell = WriteOnlyCell(ws, value=val)
+        cell._style = copy(style)
+        cells.append(cell)
+    return cells
+
+
+def write_table(ws, headers, rows, row_styles=None, lead_rows=(), freeze="A2"):
+    """Stream bold lead rows, a bold header and the data rows to a sheet.
+
+    Widths and the freeze pane are set first (write-only sheets need them
+    before any row). row_styles, if given, holds one (font, fill) pair per
+    data row; (None, None) rows are appended as plain values.
+    """
+    auto_width(ws, [*lead_rows, headers, *rows])
+    ws.freeze_panes = freeze
+    for lead in lead_rows:
+        ws.append(styled_row(ws, lead, font=BOLD_FONT))
+    ws.append(styled_row(ws, headers, font=BOLD_FONT))
+
+    if row_styles is None:
+        row_styles = [(None, None)] * len(rows)
+    append = ws.append
+    for values, (font, fill) in zip(rows, row_styles):
+        if font is None and fill is None:
+            append(values)
+        else:
+            append(styled_row(ws, values, font=font, fill=fill))
 
 
 # ─── Tab 2: EpisodeCountPivot ──────────────────────────────────
 
 
-def build_episode_count_pivot(ep_df, kpi_df, dim_df):
+def build_episode_count_pivot(ep_df, kpi_df, title_by_show):
     """Returns (DataFrame for tab, n_pass, n_fail)."""
     # Count from episodes_filtered
     ep_counts = (
-        ep_df.groupby(["show_tconst", "season_num"])
+        ep_df.groupby(["show_tconst", "season_num"], observed=True)
         .size()
         .reset_index(name="ep_count_from_episodes")
     )
@@ -137,9 +203,7 @@ def build_episode_count_pivot(ep_df, kpi_df, dim_df):
     merged.loc[merged["ep_count_from_kpis"] == -1, "ep_count_from_kpis"] = None
 
     # Add title
-    merged = merged.merge(
-        dim_df[["show_tconst", "title"]], on="show_tconst", how="left"
-    )
+    merged["title"] = merged["show_tconst"].map(title_by_show)
 
     # Deterministic sort
     merged = merged.sort_values(
@@ -159,146 +223,132 @@ def build_episode_count_pivot(ep_df, kpi_df, dim_df):
 
 def write_episode_count_pivot(ws, df):
     """Write EpisodeCountPivot tab."""
-    headers = list(df.columns)
-    ws.append(headers)
-
-    for _, row in df.iterrows():
-        ws.append(list(row))
-
-    # Conditional red fill on match=False
-    match_col = headers.index("match") + 1
-    for row_idx in range(2, len(df) + 2):
-        cell = ws.cell(row=row_idx, column=match_col)
-        if cell.value is False or cell.value == "False":
-            for col_idx in range(1, len(headers) + 1):
-                ws.cell(row=row_idx, column=col_idx).fill = RED_FILL
-
-    freeze_and_bold_header(ws)
-    auto_width(ws)
+    rows = [list(tup) for tup in df.itertuples(index=False, name=None)]
+    # Red fill on match=False
+    row_styles = [
+        (None, None) if matched else (None, RED_FILL)
+        for matched in df["match"].to_numpy()
+    ]
+    write_table(ws, list(df.columns), rows, row_styles)
 
 
 # ─── Tab 3: WeightedRatingCheck ─────────────────────────────────
 
+WEIGHTED_RATING_HEADERS = [
+    "show_tconst", "title", "season_num", "episode_tconst", "episode_num",
+    "avg_rating", "num_votes", "rating_x_votes",
+    "sum_rating_x_votes", "sum_votes", "manual_weighted_rating",
+    "sql_weighted_rating", "diff", "pass", "note",
+]
+
+
+def build_weighted_rating_check(ep_df, kpi_df, title_by_show):
+    """Returns (lazy iterator of tab rows, n_pass, n_fail)."""
+    # Pick spot-check season per show: not season 1 if possible, most episodes,
+    # tie-break lowest season_num
+    chosen = (
+        kpi_df[kpi_df["show_tconst"].isin(ep_df["show_tconst"])]
+        .assign(is_season_1=lambda d: d["season_num"] == 1)
+        .sort_values(
+            ["show_tconst", "is_season_1", "episode_count", "season_num"],
+            ascending=[True, True, False, True],
+        )
+        .drop_duplicates("show_tconst")
+        [["show_tconst", "season_num", "weighted_rating"]]
+    )
+    chosen["title"] = chosen["show_tconst"].map(
+        lambda show: title_by_show.get(show, show)
+    )
 
-def build_weighted_rating_check(ep_df, kpi_df, dim_df):
-    """Returns (list of row-dicts for the tab, n_pass, n_fail)."""
-    shows = sorted(ep_df["show_tconst"].unique())
-    rows = []
-    n_pass = 0
-    n_fail = 0
+    # Episodes for each chosen show+season, in display order
+    eps = ep_df.merge(
+        chosen[["show_tconst", "season_num", "title"]],
+        on=["show_tconst", "season_num"], how="inner",
+    )
+    eps = eps.sort_values(
+        ["show_tconst", "episode_num", "episode_tconst"]
+    ).reset_index(drop=True)
+    eps["rating_x_votes"] = eps["avg_rating"] * eps["num_votes"]
 
-    for show in shows:
-        show_kpis = kpi_df[kpi_df["show_tconst"] == show].copy()
-        show_title = dim_df.loc[
-            dim_df["show_tconst"] == show, "title"
-        ].values
-        title = show_title[0] if len(show_title) > 0 else show
+    season_stats = eps.groupby("show_tconst", sort=False, observed=True).agg(
+        sum_rxv=("rating_x_votes", "sum"),
+        sum_votes=("num_votes", "sum"),
+    )
 
-        # Pick spot-check season: not season 1 if possible, most episodes, tie-break lowest season_num
-        candidates = show_kpis.copy()
-        if len(candidates[candidates["season_num"] != 1]) > 0:
-            candidates = candidates[candidates["season_num"] != 1]
+    summary = chosen.merge(
+        season_stats, left_on="show_tconst", right_index=True, how="left"
+    )
+    summary["sum_rxv"] = summary["sum_rxv"].fillna(0.0)
+    summary["sum_votes"] = summary["sum_votes"].fillna(0).astype(int)
 
-        candidates = candidates.sort_values(
-            ["episode_count", "season_num"], ascending=[False, True]
-        )
-        chosen_season = int(candidates.iloc[0]["season_num"])
-        sql_wr = float(candidates.iloc[0]["weighted_rating"])
-
-        # Get episodes for this show+season
-        eps = ep_df[
-            (ep_df["show_tconst"] == show) & (ep_df["season_num"] == chosen_season)
-        ].copy()
-        eps = eps.sort_values(
-            ["episode_num", "episode_tconst"]
-        ).reset_index(drop=True)
-
-        eps["rating_x_votes"] = eps["avg_rating"] * eps["num_votes"]
-
-        for _, ep in eps.iterrows():
-            rows.append({
-                "show_tconst": show,
-                "title": title,
-                "season_num": chosen_season,
-                "episode_tconst": ep["episode_tconst"],
-                "episode_num": int(ep["episode_num"]),
-                "avg_rating": ep["avg_rating"],
-                "num_votes": int(ep["num_votes"]),
-                "rating_x_votes": ep["rating_x_votes"],
-                "is_summary": False,
-            })
-
-        sum_rxv = eps["rating_x_votes"].sum()
-        sum_votes = int(eps["num_votes"].sum())
-
-        if sum_votes == 0:
-            manual_wr = None
-            diff = None
-            passed = False
-            note = "sum_votes=0"
-        else:
-            manual_wr = sum_rxv / sum_votes
-            diff = abs(manual_wr - sql_wr)
-            passed = diff <= 0.01
-            note = ""
+    # sum_votes=0 leaves manual_wr/diff as NaN, which fails the check
+    summary["manual_wr"] = summary["sum_rxv"] / summary["sum_votes"].where(
+        summary["sum_votes"] != 0
+    )
+    summary["diff"] = (summary["manual_wr"] - summary["weighted_rating"]).abs()
+    summary["passed"] = summary["diff"] <= 0.01
 
-        if passed:
-            n_pass += 1
-        else:
-            n_fail += 1
-
-        rows.append({
-            "show_tconst": show,
-            "title": title,
-            "season_num": chosen_season,
-            "episode_tconst": "SUMMARY",
-            "episode_num": "",
-            "avg_rating": "",
-            "num_votes": sum_votes,
-            "rating_x_votes": sum_rxv,
-            "is_summary": True,
-            "sum_rating_x_votes": sum_rxv,
-            "sum_votes": sum_votes,
-            "manual_weighted_rating": manual_wr if manual_wr is not None else "NA",
-            "sql_weighted_rating": sql_wr,
-            "diff": diff if diff is not None else "NA",
-            "pass": passed,
-            "note": note,
-        })
-
-    return rows, n_pass, n_fail
+    # Episode detail rows as header-ordered tuples, grouped per show
+    detail = eps[[
+        "show_tconst", "title", "season_num", "episode_tconst", "episode_num",
+        "avg_rating", "num_votes", "rating_x_votes",
+    ]]
+    detail_by_show = {
+        show: list(grp.itertuples(index=False, name=None))
+        for show, grp in detail.groupby("show_tconst", sort=False, observed=True)
+    }
+
+    n_pass = int(summary["passed"].sum())
+    n_fail = len(summary) - n_pass
+    return iter_weighted_rating_rows(summary, detail_by_show), n_pass, n_fail
+
+
+def iter_weighted_rating_rows(summary, detail_by_show):
+    """Yield (row values, is_summary, passed) in WEIGHTED_RATING_HEADERS order.
+
+    Each show's episode rows come first, then its SUMMARY row.
+    """
+    # Detail rows leave the summary-only columns blank
+    blank_tail = ("",) * (len(WEIGHTED_RATING_HEADERS) - 8)
+
+    for show, title, chosen_season, sql_wr, sum_rxv, sum_votes, manual_wr, diff, passed in (
+        summary[[
+            "show_tconst", "title", "season_num", "weighted_rating",
+            "sum_rxv", "sum_votes", "manual_wr", "diff", "passed",
+        ]].itertuples(index=False, name=None)
+    ):
+        for values in detail_by_show.get(show, []):
+            yield values + blank_tail, False, None
+
+        sum_votes = int(sum_votes)
+        passed = bool(passed)
+        yield (
+            show, title, int(chosen_season), "SUMMARY", "", "",
+            sum_votes, sum_rxv,
+            sum_rxv, sum_votes,
+            manual_wr if sum_votes else "NA",
+            float(sql_wr),
+            diff if sum_votes else "NA",
+            passed,
+            "" if sum_votes else "sum_votes=0",
+        ), True, passed
 
 
 def write_weighted_rating_check(ws, rows):
-    """Write WeightedRatingCheck tab."""
-    headers = [
-        "show_tconst", "title", "season_num", "episode_tconst", "episode_num",
-        "avg_rating", "num_votes", "rating_x_votes",
-        "sum_rating_x_votes", "sum_votes", "manual_weighted_rating",
-        "sql_weighted_rating", "diff", "pass", "note",
-    ]
-    ws.append(headers)
-
-    for r in rows:
-        row_data = []
-        for h in headers:
-            val = r.get(h, "")
-            row_data.append(val)
-        ws.append(row_data)
-
-        row_idx = ws.max_row
-        if r.get("is_summary"):
-            # Bold summary rows
-            for col_idx in range(1, len(headers) + 1):
-                ws.cell(row=row_idx, column=col_idx).font = BOLD_FONT
-            # Red fill if pass=False
-            pass_col = headers.index("pass") + 1
-            if r.get("pass") is False:
-                for col_idx in range(1, len(headers) + 1):
-                    ws.cell(row=row_idx, column=col_idx).fill = RED_FILL
-
-    freeze_and_bold_header(ws)
-    auto_width(ws)
+    """Write WeightedRatingCheck tab. Returns the number of data rows written."""
+    # Widths must be known before the first row streams, so the tuples are
+    # collected once here (no intermediate per-row dicts)
+    table = []
+    row_styles = []
+    for values, is_summary, passed in rows:
+        table.append(values)
+        # Bold summary rows, red fill if pass=False
+        if is_summary:
+            row_styles.append((BOLD_FONT, None if passed else RED_FILL))
+        else:
+            row_styles.append((None, None))
+    write_table(ws, WEIGHTED_RATING_HEADERS, table, row_styles)
+    return len(table)
 
 
 # ─── Tab 4: DuplicateCheck ──────────────────────────────────────
@@ -306,52 +356,44 @@ def write_weighted_rating_check(ws, rows):
 
 def build_duplicate_check(ep_df):
     """Returns (DataFrame of duplicates, total_dup_count)."""
-    counts = ep_df["episode_tconst"].value_counts()
-    dups = counts[counts > 1].reset_index()
-    dups.columns = ["episode_tconst", "count"]
+    # One hash pass flags repeats; counting only runs on the (usually empty) residual
+    dup_mask = ep_df["episode_tconst"].duplicated(keep=False)
+    dups = (
+        ep_df.loc[dup_mask, "episode_tconst"]
+        .value_counts()
+        .rename_axis("episode_tconst")
+        .reset_index(name="count")
+    )
     dups = dups.sort_values("episode_tconst").reset_index(drop=True)
     return dups, len(dups)
 
 
 def write_duplicate_check(ws, dup_df):
     """Write DuplicateCheck tab."""
-    total = len(dup_df)
-    ws.append([f"Total duplicates: {total}"])
-    ws.cell(row=1, column=1).font = BOLD_FONT
-
-    headers = ["episode_tconst", "count"]
-    ws.append(headers)
-    for cell in ws[2]:
-        cell.font = BOLD_FONT
-
-    for _, row in dup_df.iterrows():
-        ws.append([row["episode_tconst"], int(row["count"])])
-
-    freeze_and_bold_header(ws)
-    auto_width(ws)
+    total_row = [f"Total duplicates: {len(dup_df)}"]
+    rows = [
+        [tconst, int(count)]
+        for tconst, count in dup_df.itertuples(index=False, name=None)
+    ]
+    write_table(ws, ["episode_tconst", "count"], rows, lead_rows=[total_row])
 
 
 # ─── Tab 5: SharkJumpSanity ─────────────────────────────────────
 
 
-def build_shark_jump_sanity(shark_df, kpi_df, dim_df):
+def build_shark_jump_sanity(shark_df, kpi_df, title_by_show):
     """Returns (DataFrame, n_pass, n_fail)."""
-    # Total seasons per show
-    total_seasons = (
-        kpi_df.groupby("show_tconst")["season_num"]
-        .max()
-        .reset_index()
-        .rename(columns={"season_num": "total_seasons"})
-    )
+    # Total seasons per show, indexed by show_tconst for direct probing
+    total_seasons = kpi_df.groupby(
+        "show_tconst", observed=True, sort=False
+    )["season_num"].max()
 
-    merged = shark_df.merge(
-        dim_df[["show_tconst", "title"]], on="show_tconst", how="left"
-    )
-    merged = merged.merge(total_seasons, on="show_tconst", how="left")
+    merged = shark_df.copy()
+    merged["title"] = merged["show_tconst"].map(title_by_show)
+    merged["total_seasons"] = total_seasons.reindex(merged["show_tconst"]).to_numpy()
 
-    merged["flag_suspicious"] = merged["shark_jump_season"].apply(
-        lambda x: True if pd.notna(x) and int(x) in (1, 2) else False
-    )
+    # NaN (no shark jump) is never in (1, 2), so it stays unflagged
+    merged["flag_suspicious"] = merged["shark_jump_season"].isin([1, 2])
 
     cols = [
         "show_tconst", "title", "shark_jump_season",
@@ -366,28 +408,19 @@ def build_shark_jump_sanity(shark_df, kpi_df, dim_df):
 
 def write_shark_jump_sanity(ws, df):
     """Write SharkJumpSanity tab."""
-    headers = list(df.columns)
-    ws.append(headers)
-
-    for _, row in df.iterrows():
-        ws.append(list(row))
-
+    rows = [list(tup) for tup in df.itertuples(index=False, name=None)]
     # Red fill on flag_suspicious=True
-    flag_col = headers.index("flag_suspicious") + 1
-    for row_idx in range(2, len(df) + 2):
-        cell = ws.cell(row=row_idx, column=flag_col)
-        if cell.value is True or cell.value == "True":
-            for col_idx in range(1, len(headers) + 1):
-                ws.cell(row=row_idx, column=col_idx).fill = RED_FILL
-
-    freeze_and_bold_header(ws)
-    auto_width(ws)
+    row_styles = [
+        (None, RED_FILL) if flagged else (None, None)
+        for flagged in df["flag_suspicious"].to_numpy()
+    ]
+    write_table(ws, list(df.columns), rows, row_styles)
 
 
 # ─── Tab 6: VoteCountCheck ──────────────────────────────────────
 
 
-def build_vote_count_check(ep_df, dim_df, is_sample: bool):
+def build_vote_count_check(ep_df, title_by_show, is_sample: bool):
     """Returns (DataFrame of 3 episodes, mode_label)."""
     # Sort deterministically
     sorted_eps = ep_df.sort_values(
@@ -397,66 +430,40 @@ def build_vote_count_check(ep_df, dim_df, is_sample: bool):
     n = len(sorted_eps)
 
     # Lowest: first row (ties broken by lowest episode_tconst via sort)
-    lowest = sorted_eps.iloc[0]
-
-    # Highest: last row; but ties broken by lowest episode_tconst
-    max_votes = sorted_eps["num_votes"].max()
-    highest_candidates = sorted_eps[sorted_eps["num_votes"] == max_votes]
-    highest = highest_candidates.iloc[0]  # already sorted by episode_tconst ASC
-
     # Median: floor(n/2) index
-    median_idx = n // 2
-    median = sorted_eps.iloc[median_idx]
-
-    selected = pd.DataFrame([lowest, median, highest])
-
-    # Add title (show name) from dim
-    selected = selected.merge(
-        dim_df[["show_tconst", "title"]], on="show_tconst", how="left"
-    )
-
-    selected["imdb_url"] = (
-        "https://www.imdb.com/title/" + selected["episode_tconst"] + "/"
-    )
-    selected["imdb_web_num_votes"] = ""
-    selected["notes"] = ""
-
-    cols = [
-        "episode_tconst", "title", "season_num", "episode_num",
-        "pipeline_num_votes", "imdb_url", "imdb_web_num_votes", "notes",
-    ]
-    selected = selected.rename(columns={"num_votes": "pipeline_num_votes"})
+    # Highest: first max-votes row, so ties go to the lowest episode_tconst
+    picked = sorted_eps.iloc[[0, n // 2, sorted_eps["num_votes"].idxmax()]]
+
+    # Build the tab in its final column layout in one go
+    episode_tconst = picked["episode_tconst"].to_numpy()
+    selected = pd.DataFrame({
+        "episode_tconst": episode_tconst,
+        "title": picked["show_tconst"].map(title_by_show).to_numpy(),
+        "season_num": picked["season_num"].to_numpy(),
+        "episode_num": picked["episode_num"].to_numpy(),
+        "pipeline_num_votes": picked["num_votes"].to_numpy(),
+        "imdb_url": "https://www.imdb.com/title/" + episode_tconst + "/",
+        "imdb_web_num_votes": "",
+        "notes": "",
+    })
 
     # Deterministic sort: pipeline_num_votes ASC, then episode_tconst ASC
     selected = selected.sort_values(
         ["pipeline_num_votes", "episode_tconst"], ascending=[True, True]
     ).reset_index(drop=True)
 
-    selected = selected[cols]
-
     mode_label = "SKIP" if is_sample else "MANUAL"
     return selected, mode_label
 
 
 def write_vote_count_check(ws, df, is_sample: bool):
     """Write VoteCountCheck tab."""
-    start_row = 1
-    if is_sample:
-        ws.cell(row=1, column=1, value="Synthetic data — skip manual verification.")
-        ws.cell(row=1, column=1).font = BOLD_FONT
-        start_row = 2
-
-    headers = list(df.columns)
-    for col_idx, h in enumerate(headers, 1):
-        ws.cell(row=start_row, column=col_idx, value=h)
-        ws.cell(row=start_row, column=col_idx).font = BOLD_FONT
-
-    for row_offset, (_, row) in enumerate(df.iterrows(), 1):
-        for col_idx, h in enumerate(headers, 1):
-            ws.cell(row=start_row + row_offset, column=col_idx, value=row[h])
-
-    ws.freeze_panes = f"A{start_row + 1}"
-    auto_width(ws)
+    lead_rows = [["Synthetic data — skip manual verification."]] if is_sample else []
+    rows = [list(tup) for tup in df.itertuples(index=False, name=None)]
+    write_table(
+        ws, list(df.columns), rows,
+        lead_rows=lead_rows, freeze=f"A{len(lead_rows) + 2}",
+    )
 
 
 # ─── Tab 1: QA_Summary ──────────────────────────────────────────
@@ -464,27 +471,10 @@ def write_vote_count_check(ws, df, is_sample: bool):
 
 def write_qa_summary(ws, checks):
     """Write QA_Summary tab. checks is list of (check_name, result, detail)."""
-    headers = ["check_name", "result", "detail"]
-    ws.append(headers)
-
-    for check_name, result, detail in checks:
-        ws.append([check_name, result, detail])
-
-    # Conditional fills
-    result_col = 2
-    for row_idx in range(2, len(checks) + 2):
-        cell = ws.cell(row=row_idx, column=result_col)
-        if cell.value == "PASS":
-            fill = GREEN_FILL
-        elif cell.value == "FAIL":
-            fill = RED_FILL
-        else:  # MANUAL or SKIP
-            fill = YELLOW_FILL
-        for col_idx in range(1, len(headers) + 1):
-            ws.cell(row=row_idx, column=col_idx).fill = fill
-
-    freeze_and_bold_header(ws)
-    auto_width(ws)
+    rows = [list(check) for check in checks]
+    # Conditional fills, decided up front from the result column
+    row_styles = [(None, RESULT_FILLS[result]) for _, result, _ in checks]
+    write_table(ws, ["check_name", "result", "detail"], rows, row_styles)
 
 
 # ─── Main ────────────────────────────────────────────────────────
@@ -507,22 +497,28 @@ def main():
     shark_df = dfs["shark_jump_results"]
     dim_df = dfs["dim_show_category"]
 
+    categorize_show_keys(dfs)
+
+    # Show title lookup shared by every tab (one hash probe per row)
+    title_by_show = dim_df.set_index("show_tconst")["title"].to_dict()
+
     # But episodes_filtered should come from the same place 02_run_sql reads from
     # For sample mode, 02_run_sql.py reads from SAMPLE_DIR but writes KPIs to OUTPUT_DIR
     # The episodes_filtered.csv in OUTPUT_DIR is written by 01_subset_imdb.py
     # Both modes: all Phase 1+2 outputs are in OUTPUT_DIR
 
-    wb = Workbook()
+    # Write-only workbook: rows stream to the XML writer, no Cell objects kept
+    wb = Workbook(write_only=True)
 
     # ── Tab 2: EpisodeCountPivot ──────────────────────────────
-    ecp_df, ecp_pass, ecp_fail = build_episode_count_pivot(ep_df, kpi_df, dim_df)
+    ecp_df, ecp_pass, ecp_fail = build_episode_count_pivot(ep_df, kpi_df, title_by_show)
     ws2 = wb.create_sheet("EpisodeCountPivot")
     write_episode_count_pivot(ws2, ecp_df)
 
     # ── Tab 3: WeightedRatingCheck ────────────────────────────
-    wr_rows, wr_pass, wr_fail = build_weighted_rating_check(ep_df, kpi_df, dim_df)
+    wr_rows, wr_pass, wr_fail = build_weighted_rating_check(ep_df, kpi_df, title_by_show)
     ws3 = wb.create_sheet("WeightedRatingCheck")
-    write_weighted_rating_check(ws3, wr_rows)
+    wr_total_rows = write_weighted_rating_check(ws3, wr_rows)
 
     # ── Tab 4: DuplicateCheck ─────────────────────────────────
     dup_df, dup_count = build_duplicate_check(ep_df)
@@ -530,12 +526,12 @@ def main():
     write_duplicate_check(ws4, dup_df)
 
     # ── Tab 5: SharkJumpSanity ────────────────────────────────
-    sjs_df, sjs_pass, sjs_fail = build_shark_jump_sanity(shark_df, kpi_df, dim_df)
+    sjs_df, sjs_pass, sjs_fail = build_shark_jump_sanity(shark_df, kpi_df, title_by_show)
     ws5 = wb.create_sheet("SharkJumpSanity")
     write_shark_jump_sanity(ws5, sjs_df)
 
     # ── Tab 6: VoteCountCheck ─────────────────────────────────
-    vc_df, vc_mode = build_vote_count_check(ep_df, dim_df, is_sample)
+    vc_df, vc_mode = build_vote_count_check(ep_df, title_by_show, is_sample)
     ws6 = wb.create_sheet("VoteCountCheck")
     write_vote_count_check(ws6, vc_df, is_sample)
 
@@ -571,10 +567,6 @@ def main():
     ws1 = wb.create_sheet("QA_Summary", 0)
     write_qa_summary(ws1, checks)
 
-    # Remove default "Sheet"
-    if "Sheet" in wb.sheetnames:
-        del wb["Sheet"]
-
     # ── Write workbook ────────────────────────────────────────
     EXCEL_DIR.mkdir(parents=True, exist_ok=True)
     filename = "qa_reconciliation_sample.xlsx" if is_sample else "qa_reconciliation.xlsx"
@@ -582,10 +574,6 @@ def main():
     wb.save(str(output_path))
 
     # ── STDOUT summary ────────────────────────────────────────
-    ep_total = sum(1 for r in wr_rows if not r.get("is_summary"))
-    wr_summary_count = sum(1 for r in wr_rows if r.get("is_summary"))
-    wr_total_rows = len(wr_rows)
-
     print(f"Tab 1 (QA_Summary): 5 rows, "
           f"{sum(1 for _, r, _ in checks if r == 'PASS')} passed, "
           f"{sum(1 for _, r, _ in checks if r == 'FAIL')} failed")
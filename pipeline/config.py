@@ -25,8 +25,8 @@ EPISODES_TSV = "title.episode.tsv.gz"
 RATINGS_TSV = "title.ratings.tsv.gz"
 BASICS_TSV = "title.basics.tsv.gz"
 
-# ─── Chunked Read Size ───────────────────────────────────────
-CHUNK_SIZE = 500_000
+# ─── Streaming Read Block Size (bytes per PyArrow batch) ─────
+READ_BLOCK_SIZE = 64 << 20
 
 # ─── Output CSV Column Schemas ───────────────────────────────
 EPISODES_FILTERED_COLS = [
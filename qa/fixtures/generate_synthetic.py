@@ -95,36 +95,41 @@ SHOW_META = {
 
 def generate_episodes():
     """Generate all episode rows across all shows and seasons."""
-    rows = []
-    ep_counter = 1
+    shows, season_nums, season_sizes = [], [], []
+    ratings, votes = [], []
 
+    # One draw per season, in show/season order, so the seeded stream (and
+    # therefore the committed fixtures) stays the same
     for show_tconst, seasons in SHOW_SEASONS.items():
         for season_idx, (n_eps, target_rating, base_votes) in enumerate(
             seasons, start=1
         ):
             # Generate ratings: normal distribution centered on target, clipped to [1,10]
-            ratings = RNG.normal(target_rating, 0.3, n_eps)
-            ratings = np.clip(np.round(ratings, 1), 1.0, 10.0)
+            season_ratings = RNG.normal(target_rating, 0.3, n_eps)
+            ratings.append(np.clip(np.round(season_ratings, 1), 1.0, 10.0))
 
             # Generate votes: uniform in [base-5000, base+5000], floor at 500
             vote_lo = max(500, base_votes - 5000)
             vote_hi = base_votes + 5000
-            votes = RNG.integers(vote_lo, vote_hi, n_eps)
-
-            for ep_idx in range(n_eps):
-                rows.append(
-                    {
-                        "episode_tconst": f"tt999{ep_counter:04d}",
-                        "show_tconst": show_tconst,
-                        "season_num": season_idx,
-                        "episode_num": ep_idx + 1,
-                        "avg_rating": float(ratings[ep_idx]),
-                        "num_votes": int(votes[ep_idx]),
-                    }
-                )
-                ep_counter += 1
+            votes.append(RNG.integers(vote_lo, vote_hi, n_eps))
 
-    return pd.DataFrame(rows)
+            shows.append(show_tconst)
+            season_nums.append(season_idx)
+            season_sizes.append(n_eps)
+
+    # Expand per-season values to per-episode columns in one shot
+    season_sizes = np.array(season_sizes)
+    n_total = int(season_sizes.sum())
+    return pd.DataFrame(
+        {
+            "episode_tconst": [f"tt999{i:04d}" for i in range(1, n_total + 1)],
+            "show_tconst": np.repeat(shows, season_sizes),
+            "season_num": np.repeat(season_nums, season_sizes),
+            "episode_num": np.concatenate([np.arange(1, n + 1) for n in season_sizes]),
+            "avg_rating": np.concatenate(ratings),
+            "num_votes": np.concatenate(votes),
+        }
+    )
 
 
 def generate_shows_metadata():
@@ -7,9 +7,12 @@ Usage:
 """
 
 import argparse
+import io
 import sys
+from contextlib import redirect_stdout
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
@@ -24,6 +27,11 @@ from pipeline.config import (
     EPISODES_BASICS_COLS,
 )
 
+# Selected shows, hashed once for every membership check; the sorted array
+# backs the exact-match checks
+VALID_SHOWS = frozenset(SHOW_IDS)
+VALID_SHOWS_SORTED = np.array(sorted(SHOW_IDS), dtype=object)
+
 
 def parse_args():
     parser = argparse.ArgumentParser(description="Validate pipeline outputs")
@@ -36,9 +44,159 @@ def parse_args():
     return parser.parse_args()
 
 
+# ─── Input loading ────────────────────────────────────────────
+
+PHASE2_KPI_COLS = [
+    "show_tconst", "season_num", "episode_count", "season_total_votes",
+    "weighted_rating", "mean_rating", "rating_stddev", "pct_high_rated",
+    "series_avg", "rolling_3_season_avg", "season_rank_best", "catalog_value_index",
+]
+
+# Rows per chunk when streaming episodes_basics.csv
+BASICS_CHUNK_ROWS = 500_000
+
+# Columns each check actually reads, per input file. ID/label columns are
+# pinned to str; numeric columns are left to inference so bad values reach
+# the castability/NULL checks instead of failing the read.
+READ_SPEC = {
+    "episodes_filtered.csv": {
+        "usecols": EPISODES_FILTERED_COLS,
+        "dtype": {"episode_tconst": "str", "show_tconst": "str"},
+    },
+    "shows_metadata.csv": {
+        "usecols": ["show_tconst"],
+        "dtype": {"show_tconst": "str"},
+    },
+    "episodes_basics.csv": {
+        "usecols": EPISODES_BASICS_COLS,
+        "dtype": {"episode_tconst": "str", "title_type": "str"},
+    },
+    "agg_season_kpis.csv": {
+        "usecols": [
+            "show_tconst", "season_num", "episode_count", "weighted_rating",
+            "series_avg", "rolling_3_season_avg", "catalog_value_index",
+        ],
+        "dtype": {"show_tconst": "str"},
+    },
+    "shark_jump_results.csv": {
+        "usecols": ["show_tconst", "shark_jump_season"],
+        "dtype": {"show_tconst": "str"},
+    },
+    "durability_index.csv": {
+        "usecols": ["show_tconst", "durability_index"],
+        "dtype": {"show_tconst": "str"},
+    },
+}
+
+
+def load_csv(path: Path, chunksize=None):
+    """Load only the READ_SPEC columns of a CSV. Returns (DataFrame, header).
+
+    The header is peeked separately so schema checks still see every column
+    in the file, including ones the load skips or a file is missing. With
+    chunksize, the first element is a chunk reader instead of a DataFrame.
+    """
+    header = list(pd.read_csv(path, nrows=0).columns)
+    spec = READ_SPEC[path.name]
+    usecols = [c for c in spec["usecols"] if c in header]
+    dtype = {c: t for c, t in spec["dtype"].items() if c in usecols}
+    # No usable column at all: load everything so row counts stay meaningful.
+    # The Arrow engine has no chunksize support, so streamed reads stay on C.
+    if chunksize:
+        reader = pd.read_csv(
+            path, usecols=usecols or None, dtype=dtype, chunksize=chunksize
+        )
+        return reader, header
+
+    # Whole files go through the multi-threaded Arrow parser. The str pins are
+    # applied afterwards: a partial dtype map makes the Arrow engine cast
+    # integer columns holding NULLs to int64 and fail.
+    df = pd.read_csv(path, usecols=usecols or None, engine="pyarrow")
+    return df.astype(dtype), header
+
+
+def scan_basics(path: Path, ep_ids: pd.Index):
+    """Stream episodes_basics.csv once for Checks 6-9.
+
+    Returns (row_count, non_tv_count, dup_count, missing_count), where
+    missing_count is how many of the distinct ep_ids never appear in the file.
+    """
+    n_rows = non_tv = dup_count = null_ids = 0
+    seen = set()
+    found = np.zeros(len(ep_ids), dtype=bool)
+
+    chunks, _ = load_csv(path, chunksize=BASICS_CHUNK_ROWS)
+    with chunks:
+        for chunk in chunks:
+            n_rows += len(chunk)
+            non_tv += int((chunk["title_type"] != "tvEpisode").sum())
+
+            ids = chunk["episode_tconst"]
+            null_ids += int(ids.isna().sum())
+            ids = ids.dropna()
+            n_seen = len(seen)
+            seen.update(ids)
+            dup_count += len(ids) - (len(seen) - n_seen)
+            found |= ep_ids.isin(ids)
+
+    # duplicated() also counts repeated NULL ids
+    dup_count += max(null_ids - 1, 0)
+    return n_rows, non_tv, dup_count, int((~found).sum())
+
+
 # ─── Check helpers ────────────────────────────────────────────
 
 
+def not_in(values, allowed):
+    """Distinct values of a Series missing from allowed (hash probe in C)."""
+    return values[~values.isin(allowed)].unique()
+
+
+def show_titles(tconsts):
+    """Display titles for a show_tconst Series; unknown ids stay as the id."""
+    return tconsts.map(SHOW_IDS).fillna(tconsts)
+
+
+def same_members(values, allowed_sorted):
+    """True if a Series holds exactly the distinct values of a sorted array.
+
+    For a handful of show ids, comparing sorted arrays beats hashing into sets.
+    """
+    distinct = values.drop_duplicates().sort_values().to_numpy(dtype=object)
+    return len(distinct) == len(allowed_sorted) and bool((distinct == allowed_sorted).all())
+
+
+def episode_stats(ep_df) -> dict:
+    """NULL counts and ranges for the Check 3/4 columns of episodes_filtered.
+
+    One agg per column; per-column reductions keep each column's own dtype
+    in the printed min/max.
+    """
+    n_rows = len(ep_df)
+    rating = ep_df["avg_rating"].agg(["min", "max", "count"])
+    votes = ep_df["num_votes"].agg(["min", "count"])
+    return {
+        "null_season": n_rows - ep_df["season_num"].count(),
+        "zero_season": (ep_df["season_num"] == 0).sum(),
+        "null_episode": n_rows - ep_df["episode_num"].count(),
+        "rating_min": rating["min"],
+        "rating_max": rating["max"],
+        "rating_null": n_rows - int(rating["count"]),
+        "votes_min": votes["min"],
+        "votes_null": n_rows - int(votes["count"]),
+    }
+
+
+def first_consecutive_below(rolling, series, seasons):
+    """First season whose rolling avg and the next row's are both below series_avg.
+
+    Arrays are one show's KPI rows in season order; None if no such pair.
+    """
+    below = rolling < series
+    consecutive = below[:-1] & below[1:]
+    return int(seasons[consecutive.argmax()]) if consecutive.any() else None
+
+
 class CheckRunner:
     """Tracks pass/fail/warn counts across all checks."""
 
@@ -82,18 +240,19 @@ def validate_phase1(data_dir: Path, is_sample: bool, runner: CheckRunner) -> boo
             runner.failures += 1
             return False
 
-    ep_df = pd.read_csv(ep_path)
-    shows_df = pd.read_csv(shows_path)
-    basics_df = pd.read_csv(basics_path)
+    ep_df, ep_header = load_csv(ep_path)
+    shows_df, shows_header = load_csv(shows_path)
+    # episodes_basics is streamed later (Checks 6-9); only its header here
+    basics_header = list(pd.read_csv(basics_path, nrows=0).columns)
 
     # ── Check 1: Schema — expected columns present ────────────
     print("Check 1: Schema validation")
-    for label, df, expected_cols in [
-        ("episodes_filtered", ep_df, EPISODES_FILTERED_COLS),
-        ("shows_metadata", shows_df, SHOWS_METADATA_COLS),
-        ("episodes_basics", basics_df, EPISODES_BASICS_COLS),
+    for label, header, expected_cols in [
+        ("episodes_filtered", ep_header, EPISODES_FILTERED_COLS),
+        ("shows_metadata", shows_header, SHOWS_METADATA_COLS),
+        ("episodes_basics", basics_header, EPISODES_BASICS_COLS),
     ]:
-        missing = set(expected_cols) - set(df.columns)
+        missing = set(expected_cols) - set(header)
         runner.check(
             f"{label} columns",
             len(missing) == 0,
@@ -112,7 +271,11 @@ def validate_phase1(data_dir: Path, is_sample: bool, runner: CheckRunner) -> boo
 
     # ── Check 2: No duplicate episode_tconst in episodes_filtered
     print("\nCheck 2: No duplicate episode_tconst in episodes_filtered")
-    dup_count = ep_df["episode_tconst"].duplicated().sum()
+    # One Index shared by Checks 2, 8 and 11; its hashtable is built once and
+    # cached, so the uniqueness probe and unique() below reuse it
+    ep_idx = pd.Index(ep_df["episode_tconst"])
+    # NULLs count as one value, like duplicated()
+    dup_count = 0 if ep_idx.is_unique else len(ep_idx) - ep_idx.nunique(dropna=False)
     runner.check(
         "unique episode_tconst",
         dup_count == 0,
@@ -121,9 +284,11 @@ def validate_phase1(data_dir: Path, is_sample: bool, runner: CheckRunner) -> boo
 
     # ── Check 3: No NULL/0 season_num, no NULL episode_num ────
     print("\nCheck 3: No NULL/0 season_num, no NULL episode_num")
-    null_season = ep_df["season_num"].isna().sum()
-    zero_season = (ep_df["season_num"] == 0).sum()
-    null_episode = ep_df["episode_num"].isna().sum()
+    # Check 3/4 column stats, gathered once
+    stats = episode_stats(ep_df)
+    null_season = stats["null_season"]
+    zero_season = stats["zero_season"]
+    null_episode = stats["null_episode"]
     runner.check(
         "season_num valid",
         null_season == 0 and zero_season == 0,
@@ -139,17 +304,17 @@ def validate_phase1(data_dir: Path, is_sample: bool, runner: CheckRunner) -> boo
 
     # ── Check 4: avg_rating in [1.0, 10.0], num_votes >= 0 ───
     print("\nCheck 4: Rating and vote ranges")
-    rating_min = ep_df["avg_rating"].min()
-    rating_max = ep_df["avg_rating"].max()
-    rating_null = ep_df["avg_rating"].isna().sum()
+    rating_min = stats["rating_min"]
+    rating_max = stats["rating_max"]
+    rating_null = stats["rating_null"]
     runner.check(
         "avg_rating range [1.0, 10.0]",
         rating_null == 0 and rating_min >= 1.0 and rating_max <= 10.0,
         f"range [{rating_min}, {rating_max}], {rating_null} NULL",
     )
 
-    votes_null = ep_df["num_votes"].isna().sum()
-    votes_min = ep_df["num_votes"].min()
+    votes_null = stats["votes_null"]
+    votes_min = stats["votes_min"]
     runner.check(
         "num_votes non-NULL and >= 0",
         votes_null == 0 and votes_min >= 0,
@@ -158,58 +323,56 @@ def validate_phase1(data_dir: Path, is_sample: bool, runner: CheckRunner) -> boo
 
     # ── Check 5: All show_tconst values in SHOW_IDS ──────────
     print("\nCheck 5: show_tconst membership")
-    ep_shows = set(ep_df["show_tconst"].unique())
-    valid_shows = set(SHOW_IDS.keys())
-    unexpected = ep_shows - valid_shows
+    unexpected = not_in(ep_df["show_tconst"], VALID_SHOWS)
     runner.check(
         "all show_tconst in SHOW_IDS",
         len(unexpected) == 0,
-        f"{len(ep_shows)} shows, all valid"
-        if not unexpected
-        else f"unexpected: {unexpected}",
+        f"{ep_df['show_tconst'].nunique(dropna=False)} shows, all valid"
+        if len(unexpected) == 0
+        else f"unexpected: {set(unexpected)}",
     )
 
     # ── Check 6: episodes_basics title_type == "tvEpisode" ────
     print("\nCheck 6: title_type in episodes_basics")
-    non_tv = basics_df[basics_df["title_type"] != "tvEpisode"]
+    ep_ids = ep_idx.unique()
+    basics_rows, non_tv, basics_dup, missing_from_basics = scan_basics(
+        basics_path, ep_ids
+    )
     runner.check(
         "all title_type == tvEpisode",
-        len(non_tv) == 0,
-        f"{len(basics_df)} rows, all tvEpisode"
-        if len(non_tv) == 0
-        else f"{len(non_tv)} non-tvEpisode rows",
+        non_tv == 0,
+        f"{basics_rows} rows, all tvEpisode"
+        if non_tv == 0
+        else f"{non_tv} non-tvEpisode rows",
     )
 
     # ── Check 7: No duplicate episode_tconst in episodes_basics
     print("\nCheck 7: No duplicate episode_tconst in episodes_basics")
-    basics_dup = basics_df["episode_tconst"].duplicated().sum()
     runner.check(
         "unique episode_tconst in basics",
         basics_dup == 0,
-        f"{len(basics_df)} unique" if basics_dup == 0 else f"{basics_dup} duplicates",
+        f"{basics_rows} unique" if basics_dup == 0 else f"{basics_dup} duplicates",
     )
 
     # ── Check 8: Key alignment (filtered <= basics) ───────────
     print("\nCheck 8: Key alignment")
-    ep_set = set(ep_df["episode_tconst"])
-    basics_set = set(basics_df["episode_tconst"])
-    is_subset = ep_set.issubset(basics_set)
+    is_subset = missing_from_basics == 0
     runner.check(
         "episodes_filtered.episode_tconst subset of episodes_basics",
         is_subset,
-        "subset confirmed" if is_subset else f"{len(ep_set - basics_set)} missing from basics",
+        "subset confirmed" if is_subset else f"{missing_from_basics} missing from basics",
     )
 
     # ── Check 9: Row-count parity (WARN only) ────────────────
     print("\nCheck 9: Row-count parity")
-    counts_match = len(ep_df) == len(basics_df)
+    counts_match = len(ep_df) == basics_rows
     runner.warn(
         "row counts equal",
         counts_match,
         f"both {len(ep_df)}"
         if counts_match
         else (
-            f"episodes_filtered={len(ep_df)}, episodes_basics={len(basics_df)} "
+            f"episodes_filtered={len(ep_df)}, episodes_basics={basics_rows} "
             f"(subset holds: {is_subset})"
         ),
     )
@@ -221,25 +384,27 @@ def validate_phase1(data_dir: Path, is_sample: bool, runner: CheckRunner) -> boo
         len(shows_df) == 4,
         f"{len(shows_df)} rows",
     )
-    meta_shows = set(shows_df["show_tconst"])
+    meta_ok = same_members(shows_df["show_tconst"], VALID_SHOWS_SORTED)
     runner.check(
         "show_tconst matches SHOW_IDS",
-        meta_shows == valid_shows,
+        meta_ok,
         "all 4 shows present"
-        if meta_shows == valid_shows
-        else f"mismatch: expected {valid_shows}, got {meta_shows}",
+        if meta_ok
+        else f"mismatch: expected {set(VALID_SHOWS)}, got {set(shows_df['show_tconst'])}",
     )
 
     # ── Check 11: Fabrication check (--sample only) ───────────
     if is_sample:
         print("\nCheck 11: Fabrication check (sample only)")
-        non_synthetic = ep_df[~ep_df["episode_tconst"].str.startswith("tt999")]
+        # Arrow-backed str column: startswith runs as an Arrow compute kernel,
+        # and only the mismatch count is kept (no row-subset frame)
+        non_synthetic = int((~ep_idx.str.startswith("tt999")).sum())
         runner.check(
             "all episode_tconst start with tt999",
-            len(non_synthetic) == 0,
+            non_synthetic == 0,
             f"{len(ep_df)} synthetic IDs"
-            if len(non_synthetic) == 0
-            else f"{len(non_synthetic)} non-synthetic IDs found",
+            if non_synthetic == 0
+            else f"{non_synthetic} non-synthetic IDs found",
         )
 
     return True
@@ -248,19 +413,10 @@ def validate_phase1(data_dir: Path, is_sample: bool, runner: CheckRunner) -> boo
 # ─── Phase 2 validation ────────────────────────────────────────
 
 
-PHASE2_KPI_COLS = [
-    "show_tconst", "season_num", "episode_count", "season_total_votes",
-    "weighted_rating", "mean_rating", "rating_stddev", "pct_high_rated",
-    "series_avg", "rolling_3_season_avg", "season_rank_best", "catalog_value_index",
-]
-
-
 def validate_phase2(data_dir: Path, is_sample: bool, runner: CheckRunner):
     """Run Phase 2 checks on SQL outputs in data/."""
     print("\n── Phase 2 Checks ──\n")
 
-    valid_shows = set(SHOW_IDS.keys())
-
     # ── Load Phase 2 files ───────────────────────────────────
     kpi_path = OUTPUT_DIR / "agg_season_kpis.csv"
     shark_path = OUTPUT_DIR / "shark_jump_results.csv"
@@ -272,13 +428,13 @@ def validate_phase2(data_dir: Path, is_sample: bool, runner: CheckRunner):
             runner.failures += 1
             return
 
-    kpi_df = pd.read_csv(kpi_path)
-    shark_df = pd.read_csv(shark_path)
-    dur_df = pd.read_csv(dur_path)
+    kpi_df, kpi_header = load_csv(kpi_path)
+    shark_df, shark_header = load_csv(shark_path)
+    dur_df, dur_header = load_csv(dur_path)
 
     # ── Check 12: agg_season_kpis schema ─────────────────────
     print("Check 12: agg_season_kpis schema")
-    missing_cols = set(PHASE2_KPI_COLS) - set(kpi_df.columns)
+    missing_cols = set(PHASE2_KPI_COLS) - set(kpi_header)
     runner.check(
         "expected columns present",
         len(missing_cols) == 0,
@@ -308,27 +464,30 @@ def validate_phase2(data_dir: Path, is_sample: bool, runner: CheckRunner):
 
     # ── Check 14: show_tconst in SHOW_IDS ────────────────────
     print("\nCheck 14: agg_season_kpis show_tconst membership")
-    kpi_shows = set(kpi_df["show_tconst"].unique())
-    unexpected = kpi_shows - valid_shows
+    unexpected = not_in(kpi_df["show_tconst"], VALID_SHOWS)
     runner.check(
         "all show_tconst in SHOW_IDS",
         len(unexpected) == 0,
-        f"{len(kpi_shows)} shows, all valid"
-        if not unexpected
-        else f"unexpected: {unexpected}",
+        f"{kpi_df['show_tconst'].nunique(dropna=False)} shows, all valid"
+        if len(unexpected) == 0
+        else f"unexpected: {set(unexpected)}",
     )
 
     # ── Check 15: season_num > 0, no NULLs; episode_count > 0
     print("\nCheck 15: agg_season_kpis season/episode ranges")
-    sn_null = kpi_df["season_num"].isna().sum()
-    sn_min = kpi_df["season_num"].min() if sn_null == 0 else -1
+    # One agg per column; NULL counts as len - count()
+    n_kpi = len(kpi_df)
+    sn_stats = kpi_df["season_num"].agg(["min", "count"])
+    sn_null = n_kpi - int(sn_stats["count"])
+    sn_min = sn_stats["min"] if sn_null == 0 else -1
     runner.check(
         "season_num > 0, no NULLs",
         sn_null == 0 and sn_min > 0,
         f"min={sn_min}, {sn_null} NULL",
     )
-    ec_null = kpi_df["episode_count"].isna().sum()
-    ec_min = kpi_df["episode_count"].min() if ec_null == 0 else -1
+    ec_stats = kpi_df["episode_count"].agg(["min", "count"])
+    ec_null = n_kpi - int(ec_stats["count"])
+    ec_min = ec_stats["min"] if ec_null == 0 else -1
     runner.check(
         "episode_count > 0",
         ec_null == 0 and ec_min > 0,
@@ -337,8 +496,7 @@ def validate_phase2(data_dir: Path, is_sample: bool, runner: CheckRunner):
 
     # ── Check 16: weighted_rating in [1, 10], CVI > 0 ────────
     print("\nCheck 16: agg_season_kpis value ranges")
-    wr_min = kpi_df["weighted_rating"].min()
-    wr_max = kpi_df["weighted_rating"].max()
+    wr_min, wr_max = kpi_df["weighted_rating"].agg(["min", "max"])
     runner.check(
         "weighted_rating in [1.0, 10.0]",
         wr_min >= 1.0 and wr_max <= 10.0,
@@ -354,62 +512,70 @@ def validate_phase2(data_dir: Path, is_sample: bool, runner: CheckRunner):
     # ── Check 17: shark_jump_results schema and grain ─────────
     print("\nCheck 17: shark_jump_results validation")
     shark_expected_cols = {"show_tconst", "shark_jump_season"}
-    shark_missing = shark_expected_cols - set(shark_df.columns)
+    shark_missing = shark_expected_cols - set(shark_header)
     runner.check(
         "expected columns",
         len(shark_missing) == 0,
-        f"columns: {list(shark_df.columns)}" if not shark_missing else f"missing {shark_missing}",
+        f"columns: {shark_header}" if not shark_missing else f"missing {shark_missing}",
     )
 
-    shark_shows = set(shark_df["show_tconst"].unique())
+    shark_n_shows = shark_df["show_tconst"].nunique(dropna=False)
+    shark_shows_ok = same_members(shark_df["show_tconst"], VALID_SHOWS_SORTED)
     runner.check(
         "exactly 1 row per show",
-        len(shark_df) == len(shark_shows) and shark_shows == valid_shows,
-        f"{len(shark_df)} rows, {len(shark_shows)} shows"
-        if shark_shows == valid_shows
-        else f"show mismatch: expected {valid_shows}, got {shark_shows}",
+        len(shark_df) == shark_n_shows and shark_shows_ok,
+        f"{len(shark_df)} rows, {shark_n_shows} shows"
+        if shark_shows_ok
+        else f"show mismatch: expected {set(VALID_SHOWS)}, got {set(shark_df['show_tconst'])}",
     )
 
     # shark_jump_season is NULL or int >= 3
-    for _, row in shark_df.iterrows():
-        sj = row["shark_jump_season"]
-        title = SHOW_IDS.get(row["show_tconst"], row["show_tconst"])
-        if pd.isna(sj):
+    sj_vals = shark_df["shark_jump_season"].to_numpy(dtype=float, na_value=np.nan)
+    sj_null = np.isnan(sj_vals)
+    sj_ok = sj_null | (np.trunc(sj_vals) >= 3)
+    for title, sj, is_null, ok in zip(
+        show_titles(shark_df["show_tconst"]), sj_vals, sj_null, sj_ok
+    ):
+        if is_null:
             runner.check(f"shark_jump_season {title}", True, "NULL (no shark-jump)")
         else:
             runner.check(
                 f"shark_jump_season {title}",
-                int(sj) >= 3,
-                f"season {int(sj)}" if int(sj) >= 3 else f"season {int(sj)} < 3 (invalid)",
+                bool(ok),
+                f"season {int(sj)}" if ok else f"season {int(sj)} < 3 (invalid)",
             )
 
     # ── Check 18: durability_index schema and grain ───────────
     print("\nCheck 18: durability_index validation")
     dur_expected_cols = {"show_tconst", "durability_index"}
-    dur_missing = dur_expected_cols - set(dur_df.columns)
+    dur_missing = dur_expected_cols - set(dur_header)
     runner.check(
         "expected columns",
         len(dur_missing) == 0,
-        f"columns: {list(dur_df.columns)}" if not dur_missing else f"missing {dur_missing}",
+        f"columns: {dur_header}" if not dur_missing else f"missing {dur_missing}",
     )
 
-    dur_shows = set(dur_df["show_tconst"].unique())
+    dur_n_shows = dur_df["show_tconst"].nunique(dropna=False)
+    dur_shows_ok = same_members(dur_df["show_tconst"], VALID_SHOWS_SORTED)
     runner.check(
         "exactly 1 row per show",
-        len(dur_df) == len(dur_shows) and dur_shows == valid_shows,
-        f"{len(dur_df)} rows, {len(dur_shows)} shows"
-        if dur_shows == valid_shows
-        else f"show mismatch: expected {valid_shows}, got {dur_shows}",
+        len(dur_df) == dur_n_shows and dur_shows_ok,
+        f"{len(dur_df)} rows, {dur_n_shows} shows"
+        if dur_shows_ok
+        else f"show mismatch: expected {set(VALID_SHOWS)}, got {set(dur_df['show_tconst'])}",
     )
 
     # durability_index is int >= 0
-    for _, row in dur_df.iterrows():
-        di = row["durability_index"]
-        title = SHOW_IDS.get(row["show_tconst"], row["show_tconst"])
+    di_vals = dur_df["durability_index"].to_numpy(dtype=float, na_value=np.nan)
+    di_null = np.isnan(di_vals)
+    di_ok = ~di_null & (np.trunc(di_vals) >= 0)
+    for title, di, is_null, ok in zip(
+        show_titles(dur_df["show_tconst"]), di_vals, di_null, di_ok
+    ):
         runner.check(
             f"durability_index {title}",
-            not pd.isna(di) and int(di) >= 0,
-            f"{int(di)} seasons" if not pd.isna(di) else "NULL",
+            bool(ok),
+            "NULL" if is_null else f"{int(di)} seasons",
         )
 
     # ── Check 19: Off-by-one verification (--sample only) ────
@@ -424,32 +590,24 @@ def validate_phase2(data_dir: Path, is_sample: bool, runner: CheckRunner):
         )
 
         # For each triggered show, verify the shark_jump_season value
-        for _, row in triggered.iterrows():
-            tconst = row["show_tconst"]
-            sj_season = int(row["shark_jump_season"])
+        kpi_by_show = dict(tuple(
+            kpi_df.sort_values(["show_tconst", "season_num"])
+            .groupby("show_tconst", sort=False)
+        ))
+        for tconst, sj in zip(triggered["show_tconst"], triggered["shark_jump_season"]):
+            sj_season = int(sj)
             title = SHOW_IDS.get(tconst, tconst)
 
-            show_kpis = kpi_df[kpi_df["show_tconst"] == tconst].sort_values("season_num")
-
-            # Find the first season where rolling_3_season_avg < series_avg
-            # AND the next season also has rolling_3_season_avg < series_avg
-            below_seasons = []
-            for _, krow in show_kpis.iterrows():
-                if krow["rolling_3_season_avg"] < krow["series_avg"]:
-                    below_seasons.append(int(krow["season_num"]))
-
-            # Find first consecutive pair
+            # Expected shark-jump: first season where rolling_3_season_avg <
+            # series_avg AND the next season in the KPI table is also below
             expected_sj = None
-            for i in range(len(below_seasons) - 1):
-                # Check if these are consecutive in the KPI table
-                s1 = below_seasons[i]
-                s2 = below_seasons[i + 1]
-                # They must be consecutive season_nums in the data
-                all_seasons = sorted(show_kpis["season_num"].tolist())
-                idx1 = all_seasons.index(s1)
-                if idx1 + 1 < len(all_seasons) and all_seasons[idx1 + 1] == s2:
-                    expected_sj = s1
-                    break
+            show_kpis = kpi_by_show.get(tconst)
+            if show_kpis is not None:
+                expected_sj = first_consecutive_below(
+                    show_kpis["rolling_3_season_avg"].to_numpy(),
+                    show_kpis["series_avg"].to_numpy(),
+                    show_kpis["season_num"].to_numpy(),
+                )
 
             runner.check(
                 f"off-by-one {title}",
@@ -461,27 +619,30 @@ def validate_phase2(data_dir: Path, is_sample: bool, runner: CheckRunner):
     print("\nCheck 20: Grain check")
     runner.check(
         "shark_jump_results row count",
-        len(shark_df) == len(valid_shows),
-        f"{len(shark_df)} rows (expected {len(valid_shows)})",
+        len(shark_df) == len(VALID_SHOWS),
+        f"{len(shark_df)} rows (expected {len(VALID_SHOWS)})",
     )
     runner.check(
         "durability_index row count",
-        len(dur_df) == len(valid_shows),
-        f"{len(dur_df)} rows (expected {len(valid_shows)})",
+        len(dur_df) == len(VALID_SHOWS),
+        f"{len(dur_df)} rows (expected {len(VALID_SHOWS)})",
     )
 
     # ── Check 21: Cross-file consistency ─────────────────────
     print("\nCheck 21: Cross-file consistency")
-    kpi_show_set = set(kpi_df["show_tconst"].unique())
-    shark_show_set = set(shark_df["show_tconst"].unique())
-    dur_show_set = set(dur_df["show_tconst"].unique())
-    all_equal = kpi_show_set == shark_show_set == dur_show_set == valid_shows
+    all_equal = all(
+        same_members(df["show_tconst"], VALID_SHOWS_SORTED)
+        for df in (kpi_df, shark_df, dur_df)
+    )
     runner.check(
         "show_tconst sets identical across all outputs",
         all_equal,
         "all 3 files + SHOW_IDS match"
         if all_equal
-        else f"kpi={kpi_show_set}, shark={shark_show_set}, dur={dur_show_set}",
+        else (
+            f"kpi={set(kpi_df['show_tconst'])}, shark={set(shark_df['show_tconst'])}, "
+            f"dur={set(dur_df['show_tconst'])}"
+        ),
     )
 
 
@@ -489,7 +650,22 @@ def validate_phase2(data_dir: Path, is_sample: bool, runner: CheckRunner):
 
 
 def validate(data_dir: Path, is_sample: bool, run_all: bool) -> int:
-    """Run validation checks. Returns number of failures (0 = success)."""
+    """Run validation checks. Returns number of failures (0 = success).
+
+    The report is buffered and written to stdout in one go; it is still
+    written if a check raises, so the traceback follows the partial report.
+    """
+    report = io.StringIO()
+    try:
+        with redirect_stdout(report):
+            return run_checks(data_dir, is_sample, run_all)
+    finally:
+        sys.stdout.write(report.getvalue())
+        sys.stdout.flush()
+
+
+def run_checks(data_dir: Path, is_sample: bool, run_all: bool) -> int:
+    """Run the Phase 1 (+ Phase 2) checks and print the summary."""
     runner = CheckRunner()
 
     mode_label = "sample fixtures" if is_sample else "pipeline outputs"
@@ -1,6 +1,7 @@
--- 01_schema.sql — Create dim_show and fact_episode tables from CSV inputs.
--- Placeholder tokens (__EPISODES_CSV__, __SHOWS_CSV__, __CATEGORY_CSV__)
--- are replaced at runtime by pipeline/02_run_sql.py.
+-- 01_schema.sql — Create dim_show and fact_episode tables from CSV or Parquet inputs.
+-- Placeholder tokens (__EPISODES_SRC__, __SHOWS_SRC__, __CATEGORY_SRC__)
+-- are replaced at runtime by pipeline/02_run_sql.py with read_parquet(...)
+-- or read_csv_auto(...) scans, depending on the input file type.
 
 DROP TABLE IF EXISTS fact_episode;
 DROP TABLE IF EXISTS dim_show;
@@ -14,8 +15,8 @@ SELECT
     CAST(s.end_year AS INTEGER)   AS end_year,
     s.genres,
     c.category
-FROM read_csv_auto('__SHOWS_CSV__', header = true, all_varchar = true) s
-LEFT JOIN read_csv_auto('__CATEGORY_CSV__', header = true, all_varchar = true) c
+FROM __SHOWS_SRC__ s
+LEFT JOIN __CATEGORY_SRC__ c
     ON s.show_tconst = c.show_tconst;
 
 -- ── fact_episode: 1 row per episode ─────────────────────────────────
@@ -27,4 +28,4 @@ SELECT
     CAST(episode_num AS INTEGER) AS episode_num,
     CAST(avg_rating  AS DOUBLE)  AS avg_rating,
     CAST(num_votes   AS BIGINT)  AS num_votes
-FROM read_csv_auto('__EPISODES_CSV__', header = true, all_varchar = true);
+FROM __EPISODES_SRC__;
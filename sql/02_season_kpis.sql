@@ -1,9 +1,10 @@
 -- 02_season_kpis.sql — Produces agg_season_kpis (1 row per show-season).
--- Reads from fact_episode (created by 01_schema.sql).
+-- Reads from fact_episode (created by 01_schema.sql). Materialized as a table
+-- so 03_shark_jump.sql and 04_durability.sql reuse it instead of re-aggregating.
 
-DROP VIEW IF EXISTS agg_season_kpis;
+DROP TABLE IF EXISTS agg_season_kpis;
 
-CREATE VIEW agg_season_kpis AS
+CREATE TABLE agg_season_kpis AS
 WITH season_base AS (
     SELECT
         show_tconst,
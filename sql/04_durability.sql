@@ -1,31 +1,16 @@
 -- 04_durability.sql — Computes Durability Index per show.
--- Reads from fact_episode and dim_show (created by 01_schema.sql).
+-- Produces durability_index (1 row per show).
+-- Reads from agg_season_kpis (02_season_kpis.sql) and dim_show (01_schema.sql).
 -- Durability Index = count of seasons where rolling_3_season_avg >= series_avg.
 
-WITH season_kpis AS (
-    SELECT
-        show_tconst,
-        season_num,
-        SUM(avg_rating * num_votes) * 1.0
-            / NULLIF(SUM(num_votes), 0) AS weighted_rating
-    FROM fact_episode
-    GROUP BY show_tconst, season_num
-),
-with_roll AS (
-    SELECT *,
-        AVG(weighted_rating) OVER (
-            PARTITION BY show_tconst ORDER BY season_num
-            ROWS BETWEEN 2 PRECEDING AND CURRENT ROW
-        ) AS rolling_3_season_avg,
-        -- series_avg: unweighted average of season-level weighted ratings (approved override)
-        AVG(weighted_rating) OVER (PARTITION BY show_tconst) AS series_avg
-    FROM season_kpis
-),
-durable_seasons AS (
+DROP TABLE IF EXISTS durability_index;
+
+CREATE TABLE durability_index AS
+WITH durable_seasons AS (
     SELECT
         show_tconst,
         COUNT(*) AS durability_index
-    FROM with_roll
+    FROM agg_season_kpis
     WHERE rolling_3_season_avg >= series_avg
     GROUP BY show_tconst
 )